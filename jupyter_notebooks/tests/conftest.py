@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The notebooks import `utils` from jupyter_notebooks/; make that work here too
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+from utils import TextCleaner
+
+
+@pytest.mark.parametrize('series', [
+    pd.Series([1, 2, 3], dtype=object),
+    pd.Series([b'abc', b'def']),
+    pd.Series([None, float('nan')]),
+])
+def test_clean_series_non_str_values_become_empty(series):
+    assert TextCleaner().clean_series(series).tolist() == [''] * len(series)
+
+
+def test_clean_series_mixed_values_match_clean_text():
+    cleaner = TextCleaner()
+    series = pd.Series(['Hi <b>THERE</b>', 42, None, b'bytes'])
+    assert cleaner.clean_series(series).tolist() == [cleaner.clean_text(v) for v in series]
+
+
+def test_clean_series_str_values_match_clean_text():
+    cleaner = TextCleaner()
+    series = pd.Series(['Hello   World', 'Visit http://x.com now', None, '#Tag @user sooooo'])
+    assert cleaner.clean_series(series).tolist() == [cleaner.clean_text(v) for v in series]
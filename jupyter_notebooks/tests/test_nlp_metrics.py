@@ -0,0 +1,21 @@
+import pytest
+
+from utils import NLPMetrics
+
+TOKENS = 'the cat sat on the mat and the dog sat on the log near the cat'.split()
+
+
+@pytest.mark.parametrize('window_size', [1, 2, 5])
+def test_pmi_from_cooccurrence_matches_scan(window_size):
+    cooccurrence = NLPMetrics.cooccurrence_matrix(TOKENS, window_size)
+    for word1, word2 in [('the', 'cat'), ('sat', 'on'), ('cat', 'cat'), ('dog', 'missing')]:
+        expected = NLPMetrics.pointwise_mutual_information(TOKENS, word1, word2, window_size)
+        # The matrix carries the marginals, so the token list is not read
+        assert NLPMetrics.pointwise_mutual_information(
+            [], word1, word2, window_size, cooccurrence=cooccurrence) == pytest.approx(expected)
+
+
+def test_pmi_rejects_mismatched_window():
+    cooccurrence = NLPMetrics.cooccurrence_matrix(TOKENS, window_size=2)
+    with pytest.raises(ValueError):
+        NLPMetrics.pointwise_mutual_information(TOKENS, 'the', 'cat', window_size=5, cooccurrence=cooccurrence)
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import GPUTextAnalyzer, ParallelCorpusAnalyzer
+
+
+def _corpora():
+    return {
+        'a': 'the cat sat on the mat the end'.split(),
+        'b': 'a dog sat on a log'.split(),
+        'c': [],
+    }
+
+
+def test_corpus_results_follow_in_place_mutation():
+    analyzer = ParallelCorpusAnalyzer(n_workers=1)
+    tokens = ['a', 'b', 'c', 'a']
+    corpora = {'x': tokens, 'y': ['a', 'b']}
+    assert analyzer.analyze_corpora_parallel(corpora, show_progress=False).loc['x', 'vocab_size'] == 3
+    assert analyzer.compute_pairwise_similarity(corpora).loc['x', 'y'] == 2 / 3
+    
+    tokens[3] = 'd'
+    assert analyzer.analyze_corpora_parallel(corpora, show_progress=False).loc['x', 'vocab_size'] == 4
+    assert analyzer.compute_pairwise_similarity(corpora).loc['x', 'y'] == 2 / 4
+
+
+def test_analyze_and_compare_matches_separate_calls():
+    analyzer = ParallelCorpusAnalyzer(n_workers=1)
+    corpora = _corpora()
+    stats, similarity = analyzer.analyze_and_compare_corpora(corpora, show_progress=False)
+    
+    expected = analyzer.analyze_corpora_parallel(corpora, show_progress=False)
+    pd.testing.assert_frame_equal(stats.sort_index(), expected.sort_index())
+    pd.testing.assert_frame_equal(similarity, analyzer.compute_pairwise_similarity(corpora))
+
+
+def test_analyze_and_compare_empty():
+    stats, similarity = ParallelCorpusAnalyzer(n_workers=1).analyze_and_compare_corpora({})
+    assert stats.empty and similarity.empty
+
+
+def test_tfidf_numpy_fallback_is_float32():
+    analyzer = GPUTextAnalyzer()
+    analyzer.has_gpu = False
+    docs = [tokens for tokens in _corpora().values() if tokens]
+    assert analyzer.compute_tfidf_gpu(docs)[0].dtype == np.float32
+    assert analyzer.tfidf_and_similarity(docs).dtype == np.float32
+
+
+def test_pairwise_cosine_cpu_paths_are_float32(monkeypatch):
+    from utils import parallel_nlp
+    
+    analyzer = GPUTextAnalyzer()
+    analyzer.has_gpu = False
+    docs = [tokens for tokens in _corpora().values() if tokens]
+    assert analyzer.pairwise_cosine([]).dtype == np.float32
+    assert analyzer.pairwise_cosine(docs).dtype == np.float32
+    
+    # GPU attempt that fails: the CPU fallback must keep the dtype
+    def fail(X):
+        raise RuntimeError('no device')
+    analyzer.has_gpu = True
+    monkeypatch.setattr(parallel_nlp, 'HAS_CUDA', True)
+    monkeypatch.setattr(analyzer, '_blocked_gram', fail)
+    with pytest.warns(UserWarning, match='GPU pairwise cosine failed'):
+        assert analyzer.pairwise_cosine(docs).dtype == np.float32
+
+
+def test_blocked_gram_pins_one_block(monkeypatch):
+    """Block assembly and pinned size, with no-op stand-ins for CUDA streams and events."""
+    torch = pytest.importorskip('torch')
+    import contextlib
+    
+    class Stream:
+        def wait_stream(self, stream):
+            pass
+    
+    class Event:
+        def record(self, stream=None):
+            pass
+        
+        def synchronize(self):
+            pass
+    
+    pinned = []
+    empty = torch.empty
+    
+    def tracking_empty(*args, pin_memory=False, **kwargs):
+        tensor = empty(*args, **kwargs)
+        if pin_memory:
+            pinned.append(tensor.numel() * tensor.element_size())
+        return tensor
+    
+    monkeypatch.setattr(torch, 'empty', tracking_empty)
+    monkeypatch.setattr(torch.cuda, 'Stream', Stream)
+    monkeypatch.setattr(torch.cuda, 'Event', Event)
+    monkeypatch.setattr(torch.cuda, 'current_stream', lambda: Stream())
+    monkeypatch.setattr(torch.cuda, 'stream', lambda stream: contextlib.nullcontext())
+    monkeypatch.setattr(torch.Tensor, 'record_stream', lambda self, stream: None, raising=False)
+    
+    analyzer = GPUTextAnalyzer()
+    analyzer.SIMILARITY_BLOCK_BYTES = 4 * 100 * 16  # 16 rows of 100
+    X = torch.randn(100, 8)
+    result = analyzer._blocked_gram(X)
+    
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, (X @ X.T).numpy(), atol=1e-5)
+    assert pinned == [analyzer.SIMILARITY_BLOCK_BYTES]
+
+
+def test_pairwise_cosine_gpu_matches_cpu():
+    torch = pytest.importorskip('torch')
+    if not torch.cuda.is_available():
+        pytest.skip('needs CUDA')
+    
+    analyzer = GPUTextAnalyzer(device='cuda')
+    analyzer.SIMILARITY_BLOCK_BYTES = 4 * 3 * 2  # several blocks for 3 documents
+    docs = [tokens for tokens in _corpora().values() if tokens] + [['cat', 'dog']]
+    gpu = analyzer.pairwise_cosine(docs, dtype=torch.float32)
+    analyzer.has_gpu = False
+    np.testing.assert_allclose(gpu, analyzer.pairwise_cosine(docs), atol=1e-5)
@@ -0,0 +1,62 @@
+"""
+Process pools must not fork after a numba parallel kernel has run: the forked
+interpreter hangs at exit. Each case runs in a fresh interpreter with a timeout.
+"""
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+NOTEBOOKS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs the parallel numba kernel first, so a fork-based pool would hang
+PREAMBLE = '''
+import sys
+sys.path.insert(0, {path!r})
+import warnings
+warnings.filterwarnings('ignore')
+from utils.parallel_nlp import ParallelTextProcessor, ParallelCorpusAnalyzer
+from utils.text_stats import TextStatistics
+
+if __name__ == '__main__':
+    texts = ['The cat sat on the mat. It ran!', 'A dog ran far away?'] * 600
+    ParallelTextProcessor(show_progress=False).compute_stats_batch_jit(texts)
+'''
+
+
+def _run(body: str, tmp_path) -> subprocess.CompletedProcess:
+    script = tmp_path / 'script.py'
+    script.write_text(PREAMBLE.format(path=NOTEBOOKS_DIR) + textwrap.indent(textwrap.dedent(body), '    '))
+    try:
+        return subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120)
+    except subprocess.TimeoutExpired:
+        pytest.fail('interpreter did not exit (process pool forked after a numba parallel kernel?)')
+
+
+def test_analyze_corpora_processes_exit_after_numba_parallel(tmp_path):
+    result = _run('''
+        corpora = {f'c{i}': ('x y z w ' * (50 + i)).split() for i in range(4)}
+        analyzer = ParallelCorpusAnalyzer(n_workers=2)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', UserWarning)
+            df = analyzer.analyze_corpora_parallel(corpora, show_progress=False, use_processes=True)
+        assert df.sort_index().equals(analyzer.analyze_corpora_parallel(corpora, show_progress=False).sort_index())
+        print(df.shape)
+    ''', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '(4, 12)'
+
+
+def test_compute_corpus_stats_workers_exit_after_numba_parallel(tmp_path):
+    result = _run('''
+        with warnings.catch_warnings():
+            # The sequential fallback warns; the pool itself must succeed
+            warnings.simplefilter('error', UserWarning)
+            df = TextStatistics().compute_corpus_stats(texts, n_workers=2)
+        assert df.equals(TextStatistics().compute_corpus_stats(texts))
+        print(df.shape)
+    ''', tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '(1200, 16)'
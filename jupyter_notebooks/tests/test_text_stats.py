@@ -0,0 +1,26 @@
+import pytest
+
+from utils import TextStatistics
+
+TEXT = 'The quick brown fox jumps over the lazy dog. It barks! Does it run away?'
+
+
+@pytest.mark.parametrize('score', [
+    TextStatistics.flesch_reading_ease,
+    TextStatistics.automated_readability_index,
+])
+def test_readability_uses_given_tokens(score):
+    tokens = ['extraordinarily', 'long', 'words']
+    sentences = TextStatistics.count_sentences(TEXT)
+    # An explicit sentence count never takes the byte-kernel branch
+    expected = score(TEXT, tokens=tokens, sentences=sentences)
+    assert score(TEXT, tokens=tokens) == pytest.approx(expected)
+    assert score(TEXT, tokens=tokens) != pytest.approx(score(TEXT))
+
+
+@pytest.mark.parametrize('score', [
+    TextStatistics.flesch_reading_ease,
+    TextStatistics.automated_readability_index,
+])
+def test_readability_tokens_default_to_tokenize_simple(score):
+    assert score(TEXT) == pytest.approx(score(TEXT, tokens=TextStatistics.tokenize_simple(TEXT)))
@@ -1,5 +1,5 @@
 # Utils package for NLP analysis
-from .text_stats import TextStatistics, zipfs_law_analysis, heaps_law_analysis
+from .text_stats import TextStatistics, TokenStats, zipfs_law_analysis, heaps_law_analysis
 from .nlp_metrics import NLPMetrics, compute_ngram_statistics, vocabulary_richness_summary
 from .data_cleaning import TextCleaner, flatten_list_column, detect_language_heuristic
 from .parallel_nlp import (
@@ -14,7 +14,7 @@ from .parallel_nlp import (
 )
 
 __all__ = [
-    'TextStatistics', 'NLPMetrics', 'TextCleaner',
+    'TextStatistics', 'TokenStats', 'NLPMetrics', 'TextCleaner',
     'zipfs_law_analysis', 'heaps_law_analysis',
     'compute_ngram_statistics', 'vocabulary_richness_summary',
     'flatten_list_column', 'detect_language_heuristic',
@@ -5,10 +5,17 @@ Handles common issues in social media / blog text data.
 
 import re
 import unicodedata
-from typing import List, Optional, Union
+from functools import partial
+from typing import Callable, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 
+try:
+    import pcre2
+    HAS_PCRE2 = True
+except ImportError:
+    HAS_PCRE2 = False
+
 
 class TextCleaner:
     """
@@ -33,6 +40,7 @@ class TextCleaner:
     
     # Hashtag pattern
     HASHTAG_PATTERN = re.compile(r'#\w+')
+    HASHTAG_CONTENT_PATTERN = re.compile(r'#(\w+)')
     
     # Repeated characters (3+ of same char)
     REPEATED_CHARS_PATTERN = re.compile(r'(.)\1{2,}')
@@ -43,6 +51,23 @@ class TextCleaner:
     # Non-ASCII pattern
     NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7F]+')
     
+    # PCRE2-JIT twins of the scan-heavy patterns, used by clean_series on
+    # large inputs. PCRE2's \s omits the \x1c-\x1f separators that re counts
+    # as whitespace, so they are listed explicitly.
+    PCRE2_MIN_ROWS = 50_000
+    if HAS_PCRE2:
+        URL_PATTERN_JIT = pcre2.compile(URL_PATTERN.pattern, jit=True)
+        EMAIL_PATTERN_JIT = pcre2.compile(EMAIL_PATTERN.pattern, jit=True)
+        REPEATED_CHARS_PATTERN_JIT = pcre2.compile(REPEATED_CHARS_PATTERN.pattern, jit=True)
+        MULTI_SPACE_PATTERN_JIT = pcre2.compile(r'[\s\x1c-\x1f]+', jit=True)
+    
+    # Flags that determine the cleaning pipeline built in _build_steps
+    _STEP_FLAGS = frozenset({
+        'lowercase', 'remove_urls', 'remove_html', 'remove_emails',
+        'remove_mentions', 'remove_hashtags', 'normalize_unicode',
+        'reduce_repeated_chars',
+    })
+    
     def __init__(
         self,
         lowercase: bool = True,
@@ -66,59 +91,102 @@ class TextCleaner:
         self.reduce_repeated_chars = reduce_repeated_chars
         self.min_token_length = min_token_length
         self.max_token_length = max_token_length
+        self._build_steps()
     
-    def clean_text(self, text: str) -> str:
-        """Apply all cleaning steps to a single text."""
-        if not isinstance(text, str):
-            return ""
-        
-        # Handle empty or whitespace-only strings
-        if not text.strip():
-            return ""
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the baked pipeline in sync when a flag is changed after __init__
+        if name in self._STEP_FLAGS and '_steps' in self.__dict__:
+            self._build_steps()
+    
+    def _build_steps(self) -> None:
+        """Bake the enabled cleaning steps into tuples, in pipeline order."""
+        self._steps = self._make_steps(jit=False)
+        self._jit_steps = self._make_steps(jit=True) if HAS_PCRE2 else None
+    
+    def _make_steps(self, jit: bool) -> Tuple[Callable[[str], str], ...]:
+        steps: List[Callable[[str], str]] = []
         
-        # Normalize unicode
         if self.normalize_unicode:
-            text = unicodedata.normalize('NFKD', text)
-            text = text.encode('ascii', 'ignore').decode('ascii')
-        
-        # Remove HTML tags
+            steps.append(self._normalize_unicode)
         if self.remove_html:
-            text = self.HTML_PATTERN.sub(' ', text)
-        
-        # Remove URLs
+            steps.append(self._strip_html)
         if self.remove_urls:
-            text = self.URL_PATTERN.sub(' ', text)
-        
-        # Remove emails
+            steps.append(self._strip_urls_jit if jit else self._strip_urls)
         if self.remove_emails:
-            text = self.EMAIL_PATTERN.sub(' ', text)
-        
-        # Remove mentions
+            steps.append(self._strip_emails_jit if jit else self._strip_emails)
         if self.remove_mentions:
-            text = self.MENTION_PATTERN.sub(' ', text)
-        
-        # Remove hashtags (but keep the text without #)
-        if self.remove_hashtags:
-            text = self.HASHTAG_PATTERN.sub(' ', text)
-        else:
-            # Keep hashtag content, remove # symbol
-            text = re.sub(r'#(\w+)', r'\1', text)
-        
-        # Reduce repeated characters
+            steps.append(self._strip_mentions)
+        # Remove hashtags, or keep their text without the # symbol
+        steps.append(self._strip_hashtags if self.remove_hashtags else self._unhash_hashtags)
         if self.reduce_repeated_chars:
-            text = self.REPEATED_CHARS_PATTERN.sub(r'\1\1', text)
-        
-        # Lowercase
+            pattern = self.REPEATED_CHARS_PATTERN_JIT if jit else self.REPEATED_CHARS_PATTERN
+            steps.append(partial(pattern.sub, r'\1\1'))
         if self.lowercase:
-            text = text.lower()
-        
-        # Normalize whitespace
-        text = self.MULTI_SPACE_PATTERN.sub(' ', text)
+            steps.append(str.lower)
+        pattern = self.MULTI_SPACE_PATTERN_JIT if jit else self.MULTI_SPACE_PATTERN
+        steps.append(partial(pattern.sub, ' '))
         
+        return tuple(steps)
+    
+    # Each pattern step needs a literal character to match; a substring test
+    # is much cheaper than a full regex scan, so passes that cannot match
+    # return the text untouched.
+    
+    @staticmethod
+    def _normalize_unicode(text: str) -> str:
+        # Pure-ASCII text is already in folded form
+        if text.isascii():
+            return text
+        return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    
+    def _strip_html(self, text: str) -> str:
+        return self.HTML_PATTERN.sub(' ', text) if '<' in text else text
+    
+    def _strip_urls(self, text: str) -> str:
+        return self.URL_PATTERN.sub(' ', text) if 'http' in text or 'www.' in text else text
+    
+    def _strip_emails(self, text: str) -> str:
+        return self.EMAIL_PATTERN.sub(' ', text) if '@' in text else text
+    
+    def _strip_urls_jit(self, text: str) -> str:
+        return self.URL_PATTERN_JIT.sub(' ', text) if 'http' in text or 'www.' in text else text
+    
+    def _strip_emails_jit(self, text: str) -> str:
+        return self.EMAIL_PATTERN_JIT.sub(' ', text) if '@' in text else text
+    
+    def _strip_mentions(self, text: str) -> str:
+        return self.MENTION_PATTERN.sub(' ', text) if '@' in text else text
+    
+    def _strip_hashtags(self, text: str) -> str:
+        return self.HASHTAG_PATTERN.sub(' ', text) if '#' in text else text
+    
+    def _unhash_hashtags(self, text: str) -> str:
+        return self.HASHTAG_CONTENT_PATTERN.sub(r'\1', text) if '#' in text else text
+    
+    def clean_text(self, text: str) -> str:
+        """Apply all cleaning steps to a single text."""
+        # Handle non-strings and empty or whitespace-only strings
+        if not isinstance(text, str) or not text.strip():
+            return ""
+        for step in self._steps:
+            text = step(text)
+        return text.strip()
+    
+    def _clean_text_jit(self, text: str) -> str:
+        """clean_text with the PCRE2-JIT pipeline (requires pcre2)."""
+        if not isinstance(text, str) or not text.strip():
+            return ""
+        for step in self._jit_steps:
+            text = step(text)
         return text.strip()
     
     def clean_series(self, series: pd.Series, show_progress: bool = False) -> pd.Series:
-        """Clean a pandas Series of texts."""
+        """
+        Clean a pandas Series of texts.
+        Uses the vectorized str-accessor pipeline unless a progress bar is requested;
+        with pcre2 installed, inputs of PCRE2_MIN_ROWS+ rows use the PCRE2-JIT pipeline.
+        """
         if show_progress:
             try:
                 from tqdm import tqdm
@@ -126,7 +194,51 @@ class TextCleaner:
                 return series.progress_apply(self.clean_text)
             except ImportError:
                 pass
-        return series.apply(self.clean_text)
+        # Only all-str columns (missing values allowed) can take the str-accessor
+        # and PCRE2 pipelines; mixed, bytes or numeric values go through clean_text
+        if series.empty or pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            return series.apply(self.clean_text)
+        if HAS_PCRE2 and len(series) >= self.PCRE2_MIN_ROWS:
+            return series.map(self._clean_text_jit)
+        return self.clean_series_vectorized(series)
+
+    def clean_series_vectorized(self, series: pd.Series) -> pd.Series:
+        """
+        Clean a pandas Series with one str-accessor call per cleaning step.
+        Each regex runs over the whole column at once instead of once per row.
+        Non-string entries become empty strings, as in clean_text.
+        """
+        s = series
+
+        if self.normalize_unicode:
+            s = s.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+
+        if self.remove_html:
+            s = s.str.replace(self.HTML_PATTERN, ' ', regex=True)
+
+        if self.remove_urls:
+            s = s.str.replace(self.URL_PATTERN, ' ', regex=True)
+
+        if self.remove_emails:
+            s = s.str.replace(self.EMAIL_PATTERN, ' ', regex=True)
+
+        if self.remove_mentions:
+            s = s.str.replace(self.MENTION_PATTERN, ' ', regex=True)
+
+        if self.remove_hashtags:
+            s = s.str.replace(self.HASHTAG_PATTERN, ' ', regex=True)
+        else:
+            s = s.str.replace(self.HASHTAG_CONTENT_PATTERN, r'\1', regex=True)
+
+        if self.reduce_repeated_chars:
+            s = s.str.replace(self.REPEATED_CHARS_PATTERN, r'\1\1', regex=True)
+
+        if self.lowercase:
+            s = s.str.lower()
+
+        s = s.str.replace(self.MULTI_SPACE_PATTERN, ' ', regex=True).str.strip()
+
+        return s.fillna('')
     
     def get_cleaning_stats(self, original: pd.Series, cleaned: pd.Series) -> dict:
         """Compare original vs cleaned text to quantify cleaning impact."""
@@ -143,6 +255,9 @@ class TextCleaner:
         }
 
 
+_NON_ASCII_BYTES = bytes(range(128, 256))
+
+
 def detect_language_heuristic(text: str) -> str:
     """
     Simple heuristic language detection based on character patterns.
@@ -151,8 +266,13 @@ def detect_language_heuristic(text: str) -> str:
     if not isinstance(text, str) or len(text) < 10:
         return 'unknown'
     
-    # Count ASCII vs non-ASCII characters
-    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    # Pure-ASCII text needs no counting
+    if text.isascii():
+        return 'en'
+    
+    # Count ASCII vs non-ASCII characters. Each ASCII char is a single byte
+    # < 0x80 in UTF-8, so stripping the high bytes in C leaves exactly those.
+    ascii_chars = len(text.encode('utf-8', 'surrogatepass').translate(None, _NON_ASCII_BYTES))
     total_chars = len(text)
     
     ascii_ratio = ascii_chars / total_chars if total_chars > 0 else 0
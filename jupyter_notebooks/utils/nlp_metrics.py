@@ -5,11 +5,70 @@ Includes embedding-based metrics, entropy measures, and distributional semantics
 
 import math
 import re
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Any, Union
 from collections import Counter
 import numpy as np
 import pandas as pd
 
+from .text_stats import TextStatistics, TokenStats, _intern, _n_unique
+
+try:
+    from scipy import sparse
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+try:
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.preprocessing import normalize as _sk_normalize
+    HAS_SKLEARN = True
+except ImportError:
+    HAS_SKLEARN = False
+
+
+def _identity_analyzer(tokens: List[str]) -> List[str]:
+    """CountVectorizer analyzer for input that is already tokenized."""
+    return tokens
+
+
+def _count_matrix(token_lists: List[List[str]]):
+    """
+    Document-term count matrix for pre-tokenized documents.
+    Sparse CSR via scikit-learn when available, dense NumPy otherwise.
+    """
+    if HAS_SKLEARN and any(len(tokens) for tokens in token_lists):
+        return CountVectorizer(analyzer=_identity_analyzer).fit_transform(token_lists).astype(np.float64)
+    
+    vocab: Dict[str, int] = {}
+    rows, cols = [], []
+    for doc_idx, tokens in enumerate(token_lists):
+        for t in tokens:
+            rows.append(doc_idx)
+            cols.append(vocab.setdefault(t, len(vocab)))
+    X = np.zeros((len(token_lists), len(vocab)))
+    np.add.at(X, (rows, cols), 1)
+    return X
+
+
+def _to_dense(matrix) -> np.ndarray:
+    """Materialize a sparse or dense matrix as an ndarray."""
+    return matrix.toarray() if hasattr(matrix, 'toarray') else np.asarray(matrix)
+
+
+def _ngram_pack(ids: np.ndarray, n: int, bits: int = 21) -> np.ndarray:
+    """Pack each n-gram of token ids into one int64 key, `bits` bits per id."""
+    m = ids.size - n + 1
+    packed = np.zeros(m, dtype=np.int64)
+    for k in range(n):
+        packed |= ids[k:m + k].astype(np.int64) << (bits * (n - 1 - k))
+    return packed
+
+
+def _entropy_from_counts(counts: np.ndarray) -> float:
+    """Shannon entropy (bits) of a vector of positive counts."""
+    p = counts / counts.sum()
+    return float(-(p * np.log2(p)).sum())
+
 
 class NLPMetrics:
     """
@@ -18,7 +77,7 @@ class NLPMetrics:
     """
     
     @staticmethod
-    def shannon_entropy(tokens: List[str]) -> float:
+    def shannon_entropy(tokens: Union[List[str], TokenStats]) -> float:
         """
         Shannon entropy of token distribution.
         H = -sum(p_i * log2(p_i))
@@ -26,20 +85,18 @@ class NLPMetrics:
         """
         if not tokens:
             return 0.0
+        if isinstance(tokens, TokenStats):
+            return _entropy_from_counts(tokens.counts)
         
         freq = Counter(tokens)
-        total = len(tokens)
-        
-        entropy = 0.0
-        for count in freq.values():
-            p = count / total
-            if p > 0:
-                entropy -= p * math.log2(p)
+        if not freq:
+            return 0.0
         
-        return entropy
+        counts = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
+        return _entropy_from_counts(counts)
     
     @staticmethod
-    def normalized_entropy(tokens: List[str]) -> float:
+    def normalized_entropy(tokens: Union[List[str], TokenStats]) -> float:
         """
         Normalized entropy (0-1 scale).
         H_norm = H / log2(vocab_size)
@@ -47,7 +104,7 @@ class NLPMetrics:
         if not tokens:
             return 0.0
         
-        vocab_size = len(set(tokens))
+        vocab_size = _n_unique(tokens)
         if vocab_size <= 1:
             return 0.0
         
@@ -63,19 +120,15 @@ class NLPMetrics:
         if len(tokens) < 2:
             return 0.0
         
-        # Count bigrams and unigrams
-        bigrams = [(tokens[i], tokens[i+1]) for i in range(len(tokens) - 1)]
-        bigram_freq = Counter(bigrams)
-        unigram_freq = Counter(tokens[:-1])
+        # Count bigrams as packed (prev << 32 | next) id keys, unigrams by id
+        ids, _ = _intern(tokens)
+        prev = ids[:-1].astype(np.int64)
+        keys, bigram_counts = np.unique((prev << 32) | ids[1:], return_counts=True)
+        prev_counts = np.bincount(prev)[keys >> 32]
         
-        H = 0.0
-        for bigram, count in bigram_freq.items():
-            p_bigram = count / len(bigrams)
-            p_conditional = count / unigram_freq[bigram[0]]
-            if p_conditional > 0:
-                H -= p_bigram * math.log2(p_conditional)
-        
-        return H
+        p_bigram = bigram_counts / prev.size
+        p_conditional = bigram_counts / prev_counts
+        return float(-(p_bigram * np.log2(p_conditional)).sum())
     
     @staticmethod
     def perplexity_unigram(tokens: List[str]) -> float:
@@ -94,25 +147,28 @@ class NLPMetrics:
         """
         vocab1 = set(tokens1)
         vocab2 = set(tokens2)
+        n1, n2 = len(vocab1), len(vocab2)
         
-        intersection = vocab1 & vocab2
-        union = vocab1 | vocab2
+        # Every other set size follows from the intersection by inclusion-exclusion
+        n_shared = len(vocab1 & vocab2)
+        n_union = n1 + n2 - n_shared
         
         return {
-            'jaccard_similarity': len(intersection) / len(union) if union else 0.0,
-            'dice_coefficient': 2 * len(intersection) / (len(vocab1) + len(vocab2)) if (vocab1 or vocab2) else 0.0,
-            'overlap_coefficient': len(intersection) / min(len(vocab1), len(vocab2)) if (vocab1 and vocab2) else 0.0,
-            'vocab1_coverage': len(intersection) / len(vocab1) if vocab1 else 0.0,
-            'vocab2_coverage': len(intersection) / len(vocab2) if vocab2 else 0.0,
-            'unique_to_vocab1': len(vocab1 - vocab2),
-            'unique_to_vocab2': len(vocab2 - vocab1),
-            'shared_vocab': len(intersection)
+            'jaccard_similarity': n_shared / n_union if n_union else 0.0,
+            'dice_coefficient': 2 * n_shared / (n1 + n2) if n_union else 0.0,
+            'overlap_coefficient': n_shared / min(n1, n2) if (n1 and n2) else 0.0,
+            'vocab1_coverage': n_shared / n1 if n1 else 0.0,
+            'vocab2_coverage': n_shared / n2 if n2 else 0.0,
+            'unique_to_vocab1': n1 - n_shared,
+            'unique_to_vocab2': n2 - n_shared,
+            'shared_vocab': n_shared
         }
     
     @staticmethod
     def cosine_similarity_bow(tokens1: List[str], tokens2: List[str]) -> float:
         """
         Cosine similarity using bag-of-words representation.
+        For similarities across many documents use pairwise_cosine.
         """
         freq1 = Counter(tokens1)
         freq2 = Counter(tokens2)
@@ -129,7 +185,49 @@ class NLPMetrics:
         return dot_product / (norm1 * norm2)
     
     @staticmethod
-    def lexical_density(tokens: List[str], content_words: Optional[Set[str]] = None) -> float:
+    def pairwise_cosine(token_lists: List[List[str]]) -> np.ndarray:
+        """
+        Bag-of-words cosine similarity between every pair of documents.
+        Builds one document-term matrix and takes a single (sparse) product
+        Xn @ Xn.T of the L2-normalized rows, instead of N^2 Counter builds.
+        Empty documents have similarity 0 with everything, as in cosine_similarity_bow.
+        """
+        if not token_lists:
+            return np.zeros((0, 0))
+        
+        X = _count_matrix(token_lists)
+        if HAS_SKLEARN and hasattr(X, 'toarray'):
+            Xn = _sk_normalize(X)
+        else:
+            # X is our own count matrix: row norms without a squared
+            # temporary, then normalize in place
+            norms = np.sqrt(np.einsum('ij,ij->i', X, X))
+            norms[norms == 0] = 1
+            X /= norms[:, None]
+            Xn = X
+        
+        return _to_dense(Xn @ Xn.T)
+    
+    @staticmethod
+    def pairwise_jaccard(token_lists: List[List[str]]) -> np.ndarray:
+        """
+        Vocabulary Jaccard similarity between every pair of documents.
+        Intersections come from one product of the binary incidence matrix;
+        unions follow from the row sums. Documents may also be given as their
+        vocabularies (any iterable of distinct tokens, e.g. a set or dict).
+        """
+        if not token_lists:
+            return np.zeros((0, 0))
+        
+        X_bin = (_count_matrix(token_lists) > 0).astype(np.int32)
+        intersection = _to_dense(X_bin @ X_bin.T)
+        sizes = np.asarray(X_bin.sum(axis=1)).ravel()
+        union = sizes[:, None] + sizes[None, :] - intersection
+        
+        return np.divide(intersection, union, out=np.zeros(intersection.shape), where=union > 0)
+    
+    @staticmethod
+    def lexical_density(tokens: Union[List[str], TokenStats], content_words: Optional[Set[str]] = None) -> float:
         """
         Lexical density: ratio of content words to total words.
         Higher density indicates more information-packed text.
@@ -139,7 +237,13 @@ class NLPMetrics:
         if not tokens:
             return 0.0
         
-        if content_words is None:
+        if isinstance(tokens, TokenStats):
+            # Test each word type once, weighted by its count
+            if content_words is None:
+                content_count = sum(c for t, c in tokens.counter.items() if len(t) >= 4)
+            else:
+                content_count = sum(c for t, c in tokens.counter.items() if t in content_words)
+        elif content_words is None:
             # Heuristic: words >= 4 chars are likely content words
             content_count = sum(1 for t in tokens if len(t) >= 4)
         else:
@@ -175,94 +279,164 @@ class NLPMetrics:
         """
         Average burstiness across all words with minimum frequency.
         """
-        freq = Counter(tokens)
-        frequent_words = [w for w, c in freq.items() if c >= min_freq]
+        if not tokens:
+            return 0.0
         
-        if not frequent_words:
+        ids, _ = _intern(tokens)
+        counts = np.bincount(ids)
+        frequent = counts >= min_freq
+        if not frequent.any():
             return 0.0
         
-        burstiness_values = [NLPMetrics.burstiness(tokens, w) for w in frequent_words]
-        return np.mean(burstiness_values)
+        # Positions of frequent words, grouped by word; the stable sort keeps
+        # each word's positions ascending, so in-group diffs are inter-arrival times
+        positions = np.flatnonzero(frequent[ids])
+        positions = positions[np.argsort(ids[positions], kind='stable')]
+        word_ids = ids[positions]
+        same_word = word_ids[1:] == word_ids[:-1]
+        gaps = np.diff(positions)[same_word]
+        gap_words = word_ids[1:][same_word]
+        
+        n_gaps = counts - 1
+        has_gaps = n_gaps > 0
+        mu = np.divide(np.bincount(gap_words, weights=gaps, minlength=counts.size), n_gaps,
+                       out=np.zeros(counts.size), where=has_gaps)
+        sq_dev = np.bincount(gap_words, weights=(gaps - mu[gap_words]) ** 2, minlength=counts.size)
+        sigma = np.sqrt(np.divide(sq_dev, n_gaps, out=np.zeros(counts.size), where=has_gaps))
+        
+        # Words seen once have no gaps and burstiness 0, as in burstiness()
+        mu, sigma = mu[frequent], sigma[frequent]
+        values = np.divide(sigma - mu, sigma + mu, out=np.zeros(mu.size), where=(sigma + mu) > 0)
+        return float(values.mean())
     
     @staticmethod
-    def word_frequency_distribution(tokens: List[str]) -> Dict[str, float]:
+    def word_frequency_distribution(tokens: Union[List[str], TokenStats]) -> Dict[str, float]:
         """
         Analyze word frequency distribution statistics.
         """
         if not tokens:
             return {}
         
-        freq = Counter(tokens)
-        frequencies = list(freq.values())
+        if isinstance(tokens, TokenStats):
+            counts = tokens.counts
+        else:
+            freq = Counter(tokens)
+            counts = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
         
         return {
-            'mean_frequency': np.mean(frequencies),
-            'median_frequency': np.median(frequencies),
-            'max_frequency': max(frequencies),
-            'frequency_std': np.std(frequencies),
-            'frequency_skewness': NLPMetrics._skewness(frequencies),
-            'frequency_kurtosis': NLPMetrics._kurtosis(frequencies),
-            'hapax_count': sum(1 for f in frequencies if f == 1),
-            'dis_legomena_count': sum(1 for f in frequencies if f == 2),
-            'high_freq_words': sum(1 for f in frequencies if f >= 10)
+            'mean_frequency': counts.mean(),
+            'median_frequency': np.median(counts),
+            'max_frequency': int(counts.max()),
+            'frequency_std': counts.std(),
+            'frequency_skewness': NLPMetrics._skewness(counts),
+            'frequency_kurtosis': NLPMetrics._kurtosis(counts),
+            'hapax_count': int((counts == 1).sum()),
+            'dis_legomena_count': int((counts == 2).sum()),
+            'high_freq_words': int((counts >= 10).sum())
         }
     
     @staticmethod
-    def _skewness(data: List[float]) -> float:
-        """Compute skewness of a distribution."""
-        if len(data) < 3:
+    def _skewness(data) -> float:
+        """Compute skewness of a distribution (list or ndarray)."""
+        a = np.asarray(data, dtype=np.float64)
+        n = a.size
+        if n < 3:
             return 0.0
-        n = len(data)
-        mean = np.mean(data)
-        std = np.std(data)
+        std = a.std()
         if std == 0:
             return 0.0
-        return (n / ((n - 1) * (n - 2))) * sum(((x - mean) / std) ** 3 for x in data)
+        z = (a - a.mean()) / std
+        return float((n / ((n - 1) * (n - 2))) * (z * z * z).sum())
     
     @staticmethod
-    def _kurtosis(data: List[float]) -> float:
-        """Compute excess kurtosis of a distribution."""
-        if len(data) < 4:
+    def _kurtosis(data) -> float:
+        """Compute excess kurtosis of a distribution (list or ndarray)."""
+        a = np.asarray(data, dtype=np.float64)
+        n = a.size
+        if n < 4:
             return 0.0
-        n = len(data)
-        mean = np.mean(data)
-        std = np.std(data)
+        std = a.std()
         if std == 0:
             return 0.0
-        kurt = (n * (n + 1) / ((n - 1) * (n - 2) * (n - 3))) * \
-               sum(((x - mean) / std) ** 4 for x in data)
+        z2 = ((a - a.mean()) / std) ** 2
+        kurt = (n * (n + 1) / ((n - 1) * (n - 2) * (n - 3))) * (z2 * z2).sum()
         adjustment = 3 * ((n - 1) ** 2) / ((n - 2) * (n - 3))
-        return kurt - adjustment
+        return float(kurt - adjustment)
+    
+    @staticmethod
+    def cooccurrence_matrix(tokens: List[str], window_size: int = 5) -> Tuple[Any, Dict[str, int], np.ndarray, int, int]:
+        """
+        Symmetric word co-occurrence counts within +-window_size positions.
+        Entry [a, b] counts position pairs (i, j), 0 < |i - j| <= window_size,
+        with tokens[i] == a and tokens[j] == b. Built with one vectorized
+        pass per offset; sparse CSR when SciPy is available, dense otherwise.
+        
+        Returns:
+            (matrix, vocab, counts, n, window_size) where vocab maps each word
+            to its row/column, counts[vocab[w]] is the frequency of w and n
+            is the token count
+        """
+        ids, vocab = _intern(tokens)
+        
+        rows, cols = [np.empty(0, dtype=np.int32)], [np.empty(0, dtype=np.int32)]
+        for k in range(1, min(window_size, ids.size - 1) + 1):
+            rows += [ids[:-k], ids[k:]]
+            cols += [ids[k:], ids[:-k]]
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        
+        V = len(vocab)
+        if HAS_SCIPY:
+            data = np.ones(rows.size, dtype=np.int64)
+            matrix = sparse.coo_matrix((data, (rows, cols)), shape=(V, V)).tocsr()
+        else:
+            matrix = np.zeros((V, V), dtype=np.int64)
+            np.add.at(matrix, (rows, cols), 1)
+        
+        return matrix, vocab, np.bincount(ids, minlength=V), ids.size, window_size
     
     @staticmethod
     def pointwise_mutual_information(tokens: List[str], word1: str, word2: str, 
-                                     window_size: int = 5) -> float:
+                                     window_size: int = 5,
+                                     cooccurrence: Optional[Tuple[Any, Dict[str, int], np.ndarray, int, int]] = None) -> float:
         """
         Pointwise Mutual Information between two words.
         PMI(x,y) = log2(P(x,y) / (P(x) * P(y)))
         Positive PMI indicates words co-occur more than by chance.
-        """
-        freq = Counter(tokens)
-        n = len(tokens)
-        
-        if word1 not in freq or word2 not in freq:
-            return 0.0
         
-        p_x = freq[word1] / n
-        p_y = freq[word2] / n
-        
-        # Count co-occurrences within window
-        cooccurrences = 0
-        total_windows = 0
-        
-        for i in range(len(tokens)):
-            window_start = max(0, i - window_size)
-            window_end = min(len(tokens), i + window_size + 1)
-            window = tokens[window_start:window_end]
+        When scoring many pairs, pass cooccurrence=cooccurrence_matrix(tokens, window_size)
+        so each call is a lookup instead of a scan (tokens is not read then).
+        """
+        if cooccurrence is not None:
+            matrix, vocab, counts, n, built_window = cooccurrence
+            if window_size != built_window:
+                raise ValueError(f"window_size={window_size} but the co-occurrence "
+                                 f"matrix was built with window_size={built_window}")
+            if word1 not in vocab or word2 not in vocab:
+                return 0.0
+            row = vocab[word1]
+            p_x = counts[row] / n
+            p_y = counts[vocab[word2]] / n
+            cooccurrences = int(matrix[row, vocab[word2]])
+            total_windows = int(matrix[row].sum())
+        else:
+            freq = Counter(tokens)
+            n = len(tokens)
+            
+            if word1 not in freq or word2 not in freq:
+                return 0.0
+            
+            p_x = freq[word1] / n
+            p_y = freq[word2] / n
+            
+            # Count word2 positions inside each word1 window via binary search
+            pos1 = np.array([i for i, t in enumerate(tokens) if t == word1])
+            pos2 = pos1 if word1 == word2 else np.array([i for i, t in enumerate(tokens) if t == word2])
+            window_start = np.maximum(pos1 - window_size, 0)
+            window_end = np.minimum(pos1 + window_size + 1, n)
+            in_window = np.searchsorted(pos2, window_end) - np.searchsorted(pos2, window_start)
             
-            if tokens[i] == word1:
-                cooccurrences += window.count(word2) - (1 if word1 == word2 else 0)
-                total_windows += len(window) - 1
+            cooccurrences = int(in_window.sum()) - (pos1.size if word1 == word2 else 0)
+            total_windows = int((window_end - window_start - 1).sum())
         
         if total_windows == 0 or cooccurrences == 0:
             return 0.0
@@ -282,40 +456,50 @@ def compute_ngram_statistics(tokens: List[str], n: int = 2) -> Dict[str, float]:
     if len(tokens) < n:
         return {'ngram_count': 0, 'unique_ngrams': 0, 'ngram_ttr': 0.0}
     
-    ngrams = [tuple(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
-    freq = Counter(ngrams)
+    ids, vocab = _intern(tokens)
+    bits = max(len(vocab) - 1, 1).bit_length()
+    
+    if bits * n <= 63:
+        # Each n-gram becomes one int64 key; no per-n-gram tuples are built
+        _, counts = np.unique(_ngram_pack(ids, n, bits), return_counts=True)
+    else:
+        # Vocabulary too large to pack n ids into 63 bits
+        ngrams = [tuple(tokens[i:i+n]) for i in range(len(tokens) - n + 1)]
+        counts = np.fromiter(Counter(ngrams).values(), dtype=np.int64)
+    
+    total = len(tokens) - n + 1
     
     return {
-        'ngram_count': len(ngrams),
-        'unique_ngrams': len(freq),
-        'ngram_ttr': len(freq) / len(ngrams) if ngrams else 0.0,
-        'ngram_hapax_ratio': sum(1 for c in freq.values() if c == 1) / len(ngrams) if ngrams else 0.0,
-        'ngram_entropy': NLPMetrics.shannon_entropy([str(ng) for ng in ngrams]),
-        'most_common_ngram_freq': freq.most_common(1)[0][1] / len(ngrams) if freq else 0.0
+        'ngram_count': total,
+        'unique_ngrams': int(counts.size),
+        'ngram_ttr': counts.size / total,
+        'ngram_hapax_ratio': int((counts == 1).sum()) / total,
+        'ngram_entropy': _entropy_from_counts(counts),
+        'most_common_ngram_freq': int(counts.max()) / total
     }
 
 
-def vocabulary_richness_summary(tokens: List[str]) -> Dict[str, float]:
+def vocabulary_richness_summary(tokens: Union[List[str], TokenStats]) -> Dict[str, float]:
     """
     Comprehensive vocabulary richness summary.
     """
-    from .text_stats import TextStatistics
-    
     if not tokens:
         return {}
     
+    # Count once; every metric below reads the shared counts
+    stats = tokens if isinstance(tokens, TokenStats) else TokenStats(tokens)
     ts = TextStatistics()
     
     return {
-        'vocabulary_size': len(set(tokens)),
-        'token_count': len(tokens),
-        'ttr': ts.type_token_ratio(tokens),
-        'root_ttr': ts.root_ttr(tokens),
-        'log_ttr': ts.log_ttr(tokens),
-        'mattr': ts.moving_average_ttr(tokens),
-        'hapax_ratio': ts.hapax_legomena_ratio(tokens),
-        'yules_k': ts.yules_k(tokens),
-        'simpsons_d': ts.simpsons_d(tokens),
-        'entropy': NLPMetrics.shannon_entropy(tokens),
-        'normalized_entropy': NLPMetrics.normalized_entropy(tokens)
+        'vocabulary_size': stats.unique,
+        'token_count': stats.n,
+        'ttr': ts.type_token_ratio(stats),
+        'root_ttr': ts.root_ttr(stats),
+        'log_ttr': ts.log_ttr(stats),
+        'mattr': ts.moving_average_ttr(stats),
+        'hapax_ratio': ts.hapax_legomena_ratio(stats),
+        'yules_k': ts.yules_k(stats),
+        'simpsons_d': ts.simpsons_d(stats),
+        'entropy': NLPMetrics.shannon_entropy(stats),
+        'normalized_entropy': NLPMetrics.normalized_entropy(stats)
     }
@@ -5,8 +5,14 @@ Includes lexical diversity, readability metrics, and distributional statistics.
 
 import re
 import math
+import operator
+import warnings
+import multiprocessing
 from typing import List, Dict, Tuple, Optional, Union
 from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 import numpy as np
 import pandas as pd
 
@@ -16,6 +22,340 @@ try:
 except ImportError:
     HAS_TORCH = False
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        # No-op stand-in: kernels still import and run as plain Python
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+
+# Below this many texts per worker, process startup and pickling outweigh the gain
+MIN_TEXTS_PER_WORKER = 500
+
+
+def _intern(tokens: List[str]) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Map tokens to dense int32 ids in first-occurrence order; returns (ids, vocab)."""
+    vocab: Dict[str, int] = {}
+    ids = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens), dtype=np.int32, count=len(tokens))
+    return ids, vocab
+
+
+def _first_positions(tokens: List[str]) -> np.ndarray:
+    """Position of each token's first occurrence, in one C-level dict pass."""
+    # setdefault with the position as default returns the stored first one
+    first_pos: Dict[str, int] = {}
+    return np.fromiter(map(first_pos.setdefault, tokens, range(len(tokens))), dtype=np.int64, count=len(tokens))
+
+
+def _prefix_vocab_sizes(tokens: List[str]) -> np.ndarray:
+    """Vocabulary size of every prefix: [len(set(tokens[:k])) for k in 1..N]."""
+    # A token is new exactly where its first position is its own position
+    return np.cumsum(_first_positions(tokens) == np.arange(len(tokens)))
+
+
+@njit(cache=True)
+def _mattr_kernel(ids, n_vocab, window_size):
+    """
+    Mean TTR over all windows of ids, sliding one token at a time: the window's
+    type count is updated as one token leaves and one enters.
+    """
+    counts = np.zeros(n_vocab, dtype=np.int32)
+    unique = 0
+    for i in range(window_size):
+        if counts[ids[i]] == 0:
+            unique += 1
+        counts[ids[i]] += 1
+    
+    total = unique
+    for i in range(window_size, ids.shape[0]):
+        out_id = ids[i - window_size]
+        counts[out_id] -= 1
+        if counts[out_id] == 0:
+            unique -= 1
+        in_id = ids[i]
+        if counts[in_id] == 0:
+            unique += 1
+        counts[in_id] += 1
+        total += unique
+    
+    return total / ((ids.shape[0] - window_size + 1) * window_size)
+
+
+def _mattr_numpy(ids: np.ndarray, window_size: int) -> float:
+    """
+    _mattr_kernel without numba, in whole-array steps. Token i adds one type
+    to every window that holds it but not its previous occurrence, i.e. to
+    window starts in [max(prev[i] + 1, i - window_size + 1), min(i, n - window_size)].
+    """
+    n = ids.shape[0]
+    # Previous occurrence of each token's id (-1 if none), via a stable sort
+    order = np.argsort(ids, kind='stable')
+    same = ids[order[1:]] == ids[order[:-1]]
+    prev = np.full(n, -1, dtype=np.int64)
+    prev[order[1:][same]] = order[:-1][same]
+    
+    pos = np.arange(n, dtype=np.int64)
+    first = np.maximum(prev + 1, pos - window_size + 1)
+    last = np.minimum(pos, n - window_size)
+    total = int(np.maximum(last - first + 1, 0).sum())
+    
+    return total / ((n - window_size + 1) * window_size)
+
+
+@njit(cache=True, nogil=True)
+def _syllables_kernel(buf, out):
+    """
+    Vowel-group syllable counts (see TextStatistics._count_syllables) for
+    lowercase ASCII words packed space-separated into a uint8 buffer.
+    """
+    word = 0
+    count = 0
+    prev_vowel = False
+    last = 0
+    for i in range(buf.shape[0] + 1):
+        c = buf[i] if i < buf.shape[0] else 32
+        if c == 32:
+            if last != 0:
+                # Adjust for silent e
+                if last == 101 and count > 1:
+                    count -= 1
+                out[word] = max(1, count)
+                word += 1
+            count = 0
+            prev_vowel = False
+            last = 0
+            continue
+        # a e i o u y
+        is_vowel = c == 97 or c == 101 or c == 105 or c == 111 or c == 117 or c == 121
+        if is_vowel and not prev_vowel:
+            count += 1
+        prev_vowel = is_vowel
+        last = c
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _readability_kernel(buf):
+    """
+    One pass over ASCII text bytes, mirroring tokenize_simple, count_sentences
+    and _count_syllables: returns (letters in words, words, sentences, syllables).
+    
+    A word is a maximal run of letters/digits/'_' that is all letters (the
+    \\b[a-zA-Z]+\\b matches); a sentence is a stretch between [.!?] runs that
+    holds any non-whitespace character.
+    """
+    n_chars = 0
+    n_words = 0
+    n_sentences = 0
+    n_syllables = 0
+    
+    run_len = 0
+    run_letters = True
+    syl = 0
+    prev_vowel = False
+    last = 0
+    has_content = False
+    
+    for i in range(buf.shape[0] + 1):
+        c = buf[i] if i < buf.shape[0] else 32
+        if 65 <= c <= 90:
+            c += 32
+        is_letter = 97 <= c <= 122
+        is_word = is_letter or (48 <= c <= 57) or c == 95
+        
+        if is_word:
+            run_len += 1
+            if is_letter:
+                is_vowel = c == 97 or c == 101 or c == 105 or c == 111 or c == 117 or c == 121
+                if is_vowel and not prev_vowel:
+                    syl += 1
+                prev_vowel = is_vowel
+                last = c
+            else:
+                run_letters = False
+        elif run_len > 0:
+            if run_letters:
+                n_words += 1
+                n_chars += run_len
+                # Adjust for silent e
+                if last == 101 and syl > 1:
+                    syl -= 1
+                n_syllables += max(1, syl)
+            run_len = 0
+            run_letters = True
+            syl = 0
+            prev_vowel = False
+            last = 0
+        
+        if i == buf.shape[0]:
+            break
+        if c == 46 or c == 33 or c == 63:
+            if has_content:
+                n_sentences += 1
+            has_content = False
+        elif not (c == 32 or 9 <= c <= 13 or 28 <= c <= 31):
+            has_content = True
+    
+    if has_content:
+        n_sentences += 1
+    return n_chars, n_words, n_sentences, n_syllables
+
+
+def _kernel_readable(text: Optional[str]) -> bool:
+    """Whether _readability_kernel can count text (numba installed, ASCII str)."""
+    return HAS_NUMBA and isinstance(text, str) and text.isascii()
+
+
+def _readability_counts(text: Optional[str], tokens: Optional[List[str]] = None,
+                        sentences: Optional[int] = None,
+                        syllables: bool = True) -> Tuple[int, int, int, int]:
+    """
+    (letters in words, words, sentences, syllables) needed by Flesch and ARI.
+    Given tokens (from tokenize_simple) and/or a sentence count are used as is;
+    syllables=False skips the syllable count (reported as 0).
+    
+    When _kernel_readable(text), one compiled byte sweep counts everything not
+    given (with tokens given, only the sentences).
+    """
+    kernel = sentences is None and _kernel_readable(text)
+    if kernel and tokens is None:
+        return _readability_kernel(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+    
+    if tokens is None:
+        tokens = TextStatistics.tokenize_simple(text)
+    if sentences is None:
+        # The sweep's sentence count is count_sentences', at about half the cost
+        if kernel:
+            sentences = _readability_kernel(np.frombuffer(text.encode('ascii'), dtype=np.uint8))[2]
+        else:
+            sentences = TextStatistics.count_sentences(text)
+    if not tokens or sentences == 0:
+        return 0, len(tokens), sentences, 0
+    n_syllables = int(_count_syllables_bulk(tokens).sum()) if syllables else 0
+    return sum(map(len, tokens)), len(tokens), sentences, n_syllables
+
+
+# a e i o u y
+_VOWEL_BYTES = np.zeros(256, dtype=bool)
+_VOWEL_BYTES[np.frombuffer(b'aeiouy', dtype=np.uint8)] = True
+
+
+def _syllables_numpy(buf: np.ndarray) -> np.ndarray:
+    """
+    _syllables_kernel without numba, as whole-buffer ufuncs: a syllable starts at
+    every vowel not preceded by a vowel (the separating space never is one).
+    """
+    is_vowel = _VOWEL_BYTES[buf]
+    onsets = is_vowel.copy()
+    onsets[1:] &= ~is_vowel[:-1]
+    
+    spaces = np.flatnonzero(buf == 32)
+    starts = np.concatenate(([0], spaces + 1))
+    ends = np.append(spaces, buf.shape[0])
+    counts = np.add.reduceat(onsets.astype(np.int64), starts)
+    
+    # Adjust for silent e
+    counts -= (buf[ends - 1] == 101) & (counts > 1)
+    return np.maximum(counts, 1)
+
+
+def _count_syllables_bulk(tokens: List[str]) -> np.ndarray:
+    """Syllable count of every token, in one vectorized pass over packed bytes when possible."""
+    if tokens:
+        joined = ' '.join(tokens)
+        # The packed scan needs ASCII, non-empty tokens without inner spaces
+        if joined.isascii() and joined.count(' ') == len(tokens) - 1 and all(tokens):
+            buf = np.frombuffer(joined.lower().encode('ascii'), dtype=np.uint8)
+            if HAS_NUMBA:
+                return _syllables_kernel(buf, np.empty(len(tokens), dtype=np.int64))
+            return _syllables_numpy(buf)
+    return np.fromiter(map(_count_syllables_cached, tokens), dtype=np.int64, count=len(tokens))
+
+
+# From this many tokens an id stream beats Counter (and MATTR can reuse the ids)
+_ID_STREAM_MIN_TOKENS = 100
+
+
+class TokenStats:
+    """
+    Token counts computed once and shared across metric calls.
+    Metrics that take a token list also accept a TokenStats and reuse its fields.
+    """
+    
+    __slots__ = ('tokens', 'n', 'unique', 'counts', 'ids', '_counter', '_type_pos')
+    
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.n = len(tokens)
+        if self.n >= _ID_STREAM_MIN_TOKENS:
+            # One C-level dict pass: first-occurrence positions double as token
+            # ids, and counting them gives the counts in Counter order
+            self.ids = _first_positions(tokens)
+            per_id = np.bincount(self.ids, minlength=self.n)
+            self._type_pos = np.flatnonzero(per_id)
+            self.counts = per_id[self._type_pos]
+            self._counter = None
+        else:
+            self.ids = None
+            self._counter = Counter(tokens)
+            self.counts = np.fromiter(self._counter.values(), dtype=np.int64, count=len(self._counter))
+        self.unique = len(self.counts)
+    
+    @property
+    def counter(self) -> Counter:
+        """Token Counter, built from the id stream on first use when there is one."""
+        if self._counter is None:
+            types = map(self.tokens.__getitem__, self._type_pos.tolist())
+            self._counter = Counter(dict(zip(types, self.counts.tolist())))
+        return self._counter
+    
+    def __len__(self) -> int:
+        return self.n
+
+
+# Below this many types / tokens a Python sum beats building an array
+_NUMPY_COUNTS_MIN_VOCAB = 128
+_NUMPY_LENGTHS_MIN_TOKENS = 256
+
+
+def _length_sums(tokens: List[str]) -> Tuple[int, int]:
+    """Exact (sum, sum of squares) of the token lengths."""
+    if len(tokens) < _NUMPY_LENGTHS_MIN_TOKENS:
+        lengths = list(map(len, tokens))
+        return sum(lengths), sum(map(operator.mul, lengths, lengths))
+    lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+    return int(lengths.sum()), int(lengths @ lengths)
+
+
+def _length_variance(n: int, s1: int, s2: int) -> float:
+    """Population variance from exact length sums, divided once."""
+    return (n * s2 - s1 * s1) / (n * n) if n >= 2 else 0.0
+
+
+def _sum_sq_counts(tokens: Union[List[str], TokenStats]) -> int:
+    """
+    Sum of squared type counts, reused from a TokenStats' count array when given one.
+    Exact: sum n_i^2 <= N^2, so the int64 dot product cannot overflow below ~3e9 tokens.
+    """
+    if isinstance(tokens, TokenStats):
+        counts = tokens.counts
+    else:
+        freq = Counter(tokens)
+        if len(freq) < _NUMPY_COUNTS_MIN_VOCAB:
+            return sum(map(operator.mul, freq.values(), freq.values()))
+        counts = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
+    return int(counts @ counts)
+
+
+def _n_unique(tokens: Union[List[str], TokenStats]) -> int:
+    """Vocabulary size, reused from a TokenStats when given one."""
+    return tokens.unique if isinstance(tokens, TokenStats) else len(set(tokens))
+
 
 class TextStatistics:
     """
@@ -29,6 +369,17 @@ class TextStatistics:
     # Word tokenization pattern (simple)
     WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
     
+    # ASCII fast path for WORD_PATTERN: lowercase letters, keep the other \w
+    # bytes (digits, _), blank everything else. Split pieces that are purely
+    # alphabetic are exactly the regex matches, since \b only separates \w runs.
+    _ASCII_WORD_TABLE = bytes(
+        (i + 32 if 65 <= i <= 90 else i) if (chr(i).isalnum() or i == 95) and i < 128 else 32
+        for i in range(256)
+    )
+    
+    # Byte -> b'v' for a e i o u y, b'c' for anything else (see _count_syllables)
+    _SYLLABLE_MASK = bytes(118 if i in b'aeiouy' else 99 for i in range(256))
+    
     def __init__(self, min_word_length: int = 1):
         self.min_word_length = min_word_length
     
@@ -37,6 +388,11 @@ class TextStatistics:
         """Simple whitespace + punctuation tokenization."""
         if not isinstance(text, str):
             return []
+        if text.isascii():
+            words = text.encode('ascii').translate(TextStatistics._ASCII_WORD_TABLE).decode('ascii').split()
+            return [w for w in words if w.isalpha()]
+        # Stdlib re on purpose: pcre2's JIT findall is ~6x slower here (per-match
+        # Python objects outweigh the faster scan)
         return TextStatistics.WORD_PATTERN.findall(text.lower())
     
     @staticmethod
@@ -48,7 +404,7 @@ class TextStatistics:
         return len([s for s in sentences if s.strip()])
     
     @staticmethod
-    def type_token_ratio(tokens: List[str]) -> float:
+    def type_token_ratio(tokens: Union[List[str], TokenStats]) -> float:
         """
         Type-Token Ratio (TTR): measure of lexical diversity.
         TTR = unique_words / total_words
@@ -56,61 +412,69 @@ class TextStatistics:
         """
         if not tokens:
             return 0.0
-        return len(set(tokens)) / len(tokens)
+        return _n_unique(tokens) / len(tokens)
     
     @staticmethod
-    def root_ttr(tokens: List[str]) -> float:
+    def root_ttr(tokens: Union[List[str], TokenStats]) -> float:
         """
         Root TTR (Guiraud's R): corrects for text length bias.
         R = unique_words / sqrt(total_words)
         """
         if not tokens:
             return 0.0
-        return len(set(tokens)) / math.sqrt(len(tokens))
+        return _n_unique(tokens) / math.sqrt(len(tokens))
     
     @staticmethod
-    def log_ttr(tokens: List[str]) -> float:
+    def log_ttr(tokens: Union[List[str], TokenStats]) -> float:
         """
         Log TTR (Herdan's C): another length-corrected diversity measure.
         C = log(unique_words) / log(total_words)
         """
         if len(tokens) <= 1:
             return 0.0
-        unique = len(set(tokens))
+        unique = _n_unique(tokens)
         if unique <= 1:
             return 0.0
         return math.log(unique) / math.log(len(tokens))
     
     @staticmethod
-    def moving_average_ttr(tokens: List[str], window_size: int = 100) -> float:
+    def moving_average_ttr(tokens: Union[List[str], TokenStats], window_size: int = 100) -> float:
         """
         Moving-Average TTR (MATTR): robust to text length.
         Computes TTR in sliding windows and averages.
         """
+        ids = None
+        if isinstance(tokens, TokenStats):
+            ids, tokens = tokens.ids, tokens.tokens
         if len(tokens) < window_size:
             return TextStatistics.type_token_ratio(tokens)
         
-        ttrs = []
-        for i in range(len(tokens) - window_size + 1):
-            window = tokens[i:i + window_size]
-            ttrs.append(len(set(window)) / window_size)
-        
-        return np.mean(ttrs)
+        # A TokenStats' ids are first-occurrence positions, so below len(tokens)
+        if ids is None:
+            ids, vocab = _intern(tokens)
+            n_ids = len(vocab)
+        else:
+            n_ids = len(tokens)
+        if not HAS_NUMBA:
+            return _mattr_numpy(ids, window_size)
+        return float(_mattr_kernel(ids, n_ids, window_size))
     
     @staticmethod
-    def hapax_legomena_ratio(tokens: List[str]) -> float:
+    def hapax_legomena_ratio(tokens: Union[List[str], TokenStats]) -> float:
         """
         Ratio of words appearing exactly once (hapax legomena).
         High ratio indicates rich vocabulary usage.
         """
         if not tokens:
             return 0.0
-        freq = Counter(tokens)
-        hapax = sum(1 for count in freq.values() if count == 1)
+        if isinstance(tokens, TokenStats):
+            hapax = int(np.count_nonzero(tokens.counts == 1))
+        else:
+            hapax = list(Counter(tokens).values()).count(1)
         return hapax / len(tokens)
     
     @staticmethod
-    def yules_k(tokens: List[str]) -> float:
+    def yules_k(tokens: Union[List[str], TokenStats]) -> float:
         """
         Yule's K characteristic: vocabulary richness measure.
         Lower values indicate richer vocabulary.
@@ -119,14 +483,11 @@ class TextStatistics:
         if len(tokens) < 2:
             return 0.0
         
-        freq = Counter(tokens)
         N = len(tokens)
         
-        # Count frequency of frequencies
-        freq_of_freq = Counter(freq.values())
-        
+        # sum over frequencies-of-frequencies == sum of squared type counts
         M1 = N
-        M2 = sum(count * (i ** 2) for i, count in freq_of_freq.items())
+        M2 = _sum_sq_counts(tokens)
         
         if M1 == 0:
             return 0.0
@@ -135,7 +496,7 @@ class TextStatistics:
         return K
     
     @staticmethod
-    def simpsons_d(tokens: List[str]) -> float:
+    def simpsons_d(tokens: Union[List[str], TokenStats]) -> float:
         """
         Simpson's Diversity Index: probability two random words are different.
         Higher values indicate more diversity.
@@ -143,10 +504,10 @@ class TextStatistics:
         if len(tokens) < 2:
             return 0.0
         
-        freq = Counter(tokens)
         N = len(tokens)
         
-        D = 1 - sum(n * (n - 1) for n in freq.values()) / (N * (N - 1))
+        # sum n(n-1) == sum n^2 - N since the counts add up to N
+        D = 1 - (_sum_sq_counts(tokens) - N) / (N * (N - 1))
         return D
     
     @staticmethod
@@ -154,32 +515,36 @@ class TextStatistics:
         """Average word length in characters."""
         if not tokens:
             return 0.0
-        return np.mean([len(t) for t in tokens])
+        return sum(map(len, tokens)) / len(tokens)
     
     @staticmethod
     def word_length_variance(tokens: List[str]) -> float:
         """Variance in word lengths."""
         if len(tokens) < 2:
             return 0.0
-        return np.var([len(t) for t in tokens])
+        return _length_variance(len(tokens), *_length_sums(tokens))
     
     @staticmethod
-    def flesch_reading_ease(text: str) -> float:
+    def flesch_reading_ease(text: Optional[str] = None, *, tokens: Optional[List[str]] = None,
+                            sentences: Optional[int] = None) -> float:
         """
         Flesch Reading Ease score.
         Higher = easier to read (60-70 is standard, 30-50 is college level).
-        """
-        tokens = TextStatistics.tokenize_simple(text)
-        sentences = TextStatistics.count_sentences(text)
         
-        if not tokens or sentences == 0:
+        Pass `tokens` (tokenize_simple output) and/or `sentences`
+        (count_sentences output) to reuse them instead of rescanning text.
+        """
+        # Words, sentences and syllables (simple heuristic), in one pass when
+        # nothing is given
+        _, words, sentences, syllables = _readability_counts(text, tokens, sentences)
+        return TextStatistics._flesch_from_counts(words, sentences, syllables)
+    
+    @staticmethod
+    def _flesch_from_counts(words: int, sentences: int, syllables: int) -> float:
+        """Flesch Reading Ease from pre-computed counts."""
+        if words == 0 or sentences == 0:
             return 0.0
         
-        # Estimate syllables (simple heuristic)
-        syllables = sum(TextStatistics._count_syllables(word) for word in tokens)
-        
-        words = len(tokens)
-        
         # Flesch formula
         score = 206.835 - 1.015 * (words / sentences) - 84.6 * (syllables / words)
         return max(0, min(100, score))
@@ -188,15 +553,12 @@ class TextStatistics:
     def _count_syllables(word: str) -> int:
         """Estimate syllable count using simple vowel-based heuristic."""
         word = word.lower()
-        vowels = 'aeiouy'
-        count = 0
-        prev_vowel = False
         
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_vowel:
-                count += 1
-            prev_vowel = is_vowel
+        # Vowel groups = consonant->vowel transitions in a 'c'/'v' byte mask;
+        # the leading space makes a word-initial vowel count. Multi-byte UTF-8
+        # characters map to 'c' bytes, so they still break vowel runs
+        mask = (' ' + word).encode('utf-8', 'surrogatepass').translate(TextStatistics._SYLLABLE_MASK)
+        count = mask.count(b'cv')
         
         # Adjust for silent e
         if word.endswith('e') and count > 1:
@@ -205,57 +567,127 @@ class TextStatistics:
         return max(1, count)
     
     @staticmethod
-    def automated_readability_index(text: str) -> float:
+    def automated_readability_index(text: Optional[str] = None, *, tokens: Optional[List[str]] = None,
+                                    sentences: Optional[int] = None) -> float:
         """
         Automated Readability Index (ARI).
         Estimates US grade level needed to comprehend the text.
-        """
-        tokens = TextStatistics.tokenize_simple(text)
-        sentences = TextStatistics.count_sentences(text)
         
-        if not tokens or sentences == 0:
+        `tokens` and `sentences` can be passed as for flesch_reading_ease.
+        """
+        chars, words, sentences, _ = _readability_counts(text, tokens, sentences, syllables=False)
+        return TextStatistics._ari_from_counts(chars, words, sentences)
+    
+    @staticmethod
+    def _ari_from_counts(chars: int, words: int, sentences: int) -> float:
+        """ARI from pre-computed counts."""
+        if words == 0 or sentences == 0:
             return 0.0
         
-        chars = sum(len(t) for t in tokens)
-        words = len(tokens)
-        
         ARI = 4.71 * (chars / words) + 0.5 * (words / sentences) - 21.43
         return max(0, ARI)
     
     def compute_all_stats(self, text: str) -> Dict[str, float]:
         """Compute all available statistics for a text."""
-        tokens = self.tokenize_simple(text)
+        # Tokenize once; sentences, syllables and letters of all raw tokens come
+        # from one sweep (the numba byte kernel for ASCII text, which recounts
+        # the words itself; otherwise the tokens are reused)
+        raw_tokens = self.tokenize_simple(text)
+        raw_chars, _, sentences, syllables = _readability_counts(
+            text, None if _kernel_readable(text) else raw_tokens)
         
-        # Filter by min word length
-        tokens = [t for t in tokens if len(t) >= self.min_word_length]
+        # Filter by min word length (readability scores use all tokens)
+        if self.min_word_length > 1:
+            tokens = [t for t in raw_tokens if len(t) >= self.min_word_length]
+        else:
+            tokens = raw_tokens
+        
+        # One Counter for the type-based metrics, one length pass for the rest
+        stats = TokenStats(tokens)
+        n = stats.n
+        char_sum, char_sq_sum = _length_sums(tokens)
         
         return {
-            'token_count': len(tokens),
-            'unique_tokens': len(set(tokens)),
-            'sentence_count': self.count_sentences(text),
+            'token_count': n,
+            'unique_tokens': stats.unique,
+            'sentence_count': sentences,
             'char_count': len(text) if isinstance(text, str) else 0,
-            'ttr': self.type_token_ratio(tokens),
-            'root_ttr': self.root_ttr(tokens),
-            'log_ttr': self.log_ttr(tokens),
-            'mattr_100': self.moving_average_ttr(tokens, 100),
-            'hapax_ratio': self.hapax_legomena_ratio(tokens),
-            'yules_k': self.yules_k(tokens),
-            'simpsons_d': self.simpsons_d(tokens),
-            'avg_word_length': self.average_word_length(tokens),
-            'word_length_var': self.word_length_variance(tokens),
-            'flesch_reading_ease': self.flesch_reading_ease(text),
-            'ari': self.automated_readability_index(text),
-            'avg_sentence_length': len(tokens) / max(1, self.count_sentences(text))
+            'ttr': self.type_token_ratio(stats),
+            'root_ttr': self.root_ttr(stats),
+            'log_ttr': self.log_ttr(stats),
+            'mattr_100': self.moving_average_ttr(stats, 100),
+            'hapax_ratio': self.hapax_legomena_ratio(stats),
+            'yules_k': self.yules_k(stats),
+            'simpsons_d': self.simpsons_d(stats),
+            'avg_word_length': char_sum / n if n else 0.0,
+            'word_length_var': _length_variance(n, char_sum, char_sq_sum),
+            'flesch_reading_ease': self._flesch_from_counts(len(raw_tokens), sentences, syllables),
+            'ari': self._ari_from_counts(raw_chars, len(raw_tokens), sentences),
+            'avg_sentence_length': n / max(1, sentences)
         }
     
-    def compute_corpus_stats(self, texts: List[str]) -> pd.DataFrame:
-        """Compute statistics for a corpus of texts."""
+    def compute_corpus_stats(self, texts: List[str], n_workers: int = 1) -> pd.DataFrame:
+        """
+        Compute statistics for a corpus of texts.
+        
+        Args:
+            texts: Texts to analyze
+            n_workers: Worker processes (default 1: in-process). With more, the
+                texts are split into one contiguous chunk per worker, pickled
+                to the workers, and the rows come back in input order. Workers
+                are spawned, so scripts must call this under
+                `if __name__ == '__main__'`
+        """
+        if n_workers > 1 and len(texts) >= MIN_TEXTS_PER_WORKER * n_workers:
+            texts = list(texts)
+            size = -(-len(texts) // n_workers)
+            chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+            # spawn, not fork: a fork after a numba parallel kernel (e.g.
+            # parallel_nlp._stats_kernel) has run leaves the interpreter hanging at exit
+            spawn = multiprocessing.get_context('spawn')
+            try:
+                with ProcessPoolExecutor(max_workers=n_workers, mp_context=spawn) as executor:
+                    parts = executor.map(_stats_worker, chunks, repeat(self.min_word_length))
+                    return pd.DataFrame(list(chain.from_iterable(parts)))
+            except Exception as e:
+                warnings.warn(f"Parallel corpus stats failed: {e}, using sequential")
+        
         results = []
         for text in texts:
             results.append(self.compute_all_stats(text))
         return pd.DataFrame(results)
 
 
+# Per-token syllable counts for _count_syllables_bulk's fallback; a few frequent
+# types make up most tokens, so repeats become a single lookup
+_count_syllables_cached = lru_cache(maxsize=1 << 16)(TextStatistics._count_syllables)
+
+
+def _stats_worker(texts: List[str], min_word_length: int) -> List[Dict[str, float]]:
+    """compute_all_stats over a chunk of texts (top level so worker processes can unpickle it)."""
+    stats = TextStatistics(min_word_length=min_word_length)
+    return [stats.compute_all_stats(text) for text in texts]
+
+
+def _ols1(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    (slope, intercept) of the least-squares line y = slope * x + intercept, in
+    closed form (cov / var through the means; no Vandermonde/SVD as in polyfit).
+    """
+    x_mean, y_mean = x.mean(), y.mean()
+    dx = x - x_mean
+    slope = float(dx @ (y - y_mean) / (dx @ dx))
+    return slope, float(y_mean - slope * x_mean)
+
+
+def _heaps_fit(corpus_sizes: np.ndarray, vocab_sizes: np.ndarray) -> Tuple[float, float]:
+    """(K, beta) of V = K * N^beta from a log-log fit; (0, 0) for a single sample."""
+    if len(corpus_sizes) <= 1:
+        return 0.0, 0.0
+    beta, log_K = _ols1(np.log(corpus_sizes.astype(np.float64)), np.log(vocab_sizes.astype(np.float64)))
+    return math.exp(log_K), beta
+
+
 def zipfs_law_analysis(tokens: List[str]) -> Tuple[np.ndarray, np.ndarray, float]:
     """
     Analyze adherence to Zipf's Law.
@@ -265,18 +697,18 @@ def zipfs_law_analysis(tokens: List[str]) -> Tuple[np.ndarray, np.ndarray, float
         return np.array([]), np.array([]), 0.0
     
     freq = Counter(tokens)
-    sorted_freq = sorted(freq.values(), reverse=True)
+    frequencies = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
+    frequencies.sort()
+    frequencies = frequencies[::-1]
     
-    ranks = np.arange(1, len(sorted_freq) + 1)
-    frequencies = np.array(sorted_freq)
+    ranks = np.arange(1, len(frequencies) + 1)
     
     # Estimate Zipf exponent via log-log linear regression
     if len(ranks) > 1:
         log_ranks = np.log(ranks)
         log_freqs = np.log(frequencies)
         
-        # Simple linear regression
-        slope, _ = np.polyfit(log_ranks, log_freqs, 1)
+        slope, _ = _ols1(log_ranks, log_freqs)
         zipf_exponent = -slope
     else:
         zipf_exponent = 0.0
@@ -308,44 +740,15 @@ def heaps_law_analysis(tokens: List[str], step: int = 100, use_gpu: bool = False
 
 def _heaps_law_cpu_optimized(tokens: List[str], step: int) -> Tuple[np.ndarray, np.ndarray, float, float]:
     """
-    Optimized CPU implementation using efficient set tracking and vectorized operations.
+    Optimized CPU implementation: one interning pass, then vectorized prefix vocab sizes.
     """
-    # Pre-allocate arrays based on expected size
-    num_samples = (len(tokens) + step - 1) // step
-    corpus_sizes = np.empty(num_samples, dtype=np.int64)
-    vocab_sizes = np.empty(num_samples, dtype=np.int64)
-    
-    # Use dict-based vocabulary tracking for better performance
-    vocab = {}
-    sample_idx = 0
-    
-    # Single pass through tokens with incremental vocabulary building
-    for i in range(0, len(tokens), step):
-        end_idx = min(i + step, len(tokens))
-        
-        # Only update vocab with new tokens in this step
-        for token in tokens[i:end_idx]:
-            vocab[token] = vocab.get(token, 0) + 1
-        
-        corpus_sizes[sample_idx] = end_idx
-        vocab_sizes[sample_idx] = len(vocab)
-        sample_idx += 1
-    
-    # Trim arrays to actual size
-    corpus_sizes = corpus_sizes[:sample_idx]
-    vocab_sizes = vocab_sizes[:sample_idx]
+    # One C-level dict pass marks first occurrences; every prefix vocabulary
+    # size follows from their running count, so no per-step set/dict work
+    corpus_sizes = np.minimum(np.arange(step, len(tokens) + step, step, dtype=np.int64), len(tokens))
+    vocab_sizes = _prefix_vocab_sizes(tokens)[corpus_sizes - 1]
     
     # Vectorized log-log regression
-    if len(corpus_sizes) > 1:
-        log_N = np.log(corpus_sizes.astype(np.float64))
-        log_V = np.log(vocab_sizes.astype(np.float64))
-        
-        # Use polyfit with explicit degree for clarity and performance
-        coeffs = np.polyfit(log_N, log_V, 1)
-        beta = coeffs[0]
-        K = np.exp(coeffs[1])
-    else:
-        K, beta = 0.0, 0.0
+    K, beta = _heaps_fit(corpus_sizes, vocab_sizes)
     
     return corpus_sizes, vocab_sizes, K, beta
 
@@ -353,55 +756,22 @@ def _heaps_law_cpu_optimized(tokens: List[str], step: int) -> Tuple[np.ndarray,
 def _heaps_law_gpu(tokens: List[str], step: int) -> Tuple[np.ndarray, np.ndarray, float, float]:
     """
     GPU-accelerated implementation using PyTorch.
-    Much faster for large token lists (100K+ tokens).
+    Without CUDA the same tensor ops run on the CPU; no per-chunk set or
+    seen-array loop is involved on either device.
     """
-    # Create mapping from tokens to unique indices
-    unique_tokens = list(set(tokens))
-    token_to_idx = {token: idx for idx, token in enumerate(unique_tokens)}
-    
-    # Convert tokens to indices array
-    token_indices = np.array([token_to_idx[token] for token in tokens], dtype=np.int32)
-    
-    # Move to GPU
+    # First-occurrence positions are the only host pass; new-type flags,
+    # their running count and the step gather all run on the device
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    token_tensor = torch.tensor(token_indices, dtype=torch.long, device=device)
-    
-    # Pre-allocate result arrays
-    num_samples = (len(tokens) + step - 1) // step
-    corpus_sizes = []
-    vocab_sizes = []
+    first = torch.from_numpy(_first_positions(tokens)).to(device)
     
-    # Efficient vocabulary tracking using a set on GPU (simulated with hash set)
-    seen_tokens = set()
+    corpus_sizes = np.minimum(np.arange(step, len(tokens) + step, step, dtype=np.int64), len(tokens))
+    with torch.inference_mode():
+        is_first = first == torch.arange(len(tokens), device=device)
+        running_vocab = torch.cumsum(is_first, dim=0)
+        vocab_sizes = running_vocab[torch.from_numpy(corpus_sizes - 1).to(device)].cpu().numpy()
     
-    for i in range(0, len(tokens), step):
-        end_idx = min(i + step, len(tokens))
-        
-        # Add new tokens to seen set
-        seen_tokens.update(token_indices[i:end_idx])
-        
-        corpus_sizes.append(end_idx)
-        vocab_sizes.append(len(seen_tokens))
-    
-    corpus_sizes = np.array(corpus_sizes, dtype=np.int64)
-    vocab_sizes = np.array(vocab_sizes, dtype=np.int64)
-    
-    # Log-log regression on GPU for better performance
-    corpus_tensor = torch.tensor(corpus_sizes, dtype=torch.float32, device=device)
-    vocab_tensor = torch.tensor(vocab_sizes, dtype=torch.float32, device=device)
-    
-    log_N = torch.log(corpus_tensor)
-    log_V = torch.log(vocab_tensor)
-    
-    # GPU-accelerated linear regression
-    if len(corpus_sizes) > 1:
-        # Prepare data for polyfit: [log_N, ones] for solving
-        A = torch.stack([log_N, torch.ones_like(log_N)], dim=1)
-        # Solve using least squares (on GPU)
-        coeffs, _ = torch.lstsq(log_V.unsqueeze(1), A)
-        beta = coeffs[0, 0].item()
-        K = torch.exp(coeffs[1, 0]).item()
-    else:
-        K, beta = 0.0, 0.0
+    # Log-log regression: one sample per step, so closed-form least squares
+    # on the host is cheaper than a device round trip
+    K, beta = _heaps_fit(corpus_sizes, vocab_sizes)
     
     return corpus_sizes, vocab_sizes, K, beta